@@ -4,260 +4,354 @@ Timing utilities for parsing, formatting, and adjusting track timings.
 
 import logging
 from datetime import timedelta
+from functools import lru_cache
 
 from dj_set_downloader import DomainTrack
 
 logger = logging.getLogger(__name__)
 
 
-class TimingUtils:
-    """Utility class for handling timing operations and track alignment."""
+@lru_cache(maxsize=4096)
+def _to_seconds(t: str) -> int:
+    """Convert 'H:MM:SS' or 'MM:SS' string to a whole number of seconds."""
+    if not t:
+        raise ValueError("Empty time string")
 
-    def parse_time(self, t: str) -> timedelta:
-        """Convert 'H:MM:SS' or 'MM:SS' string to timedelta."""
-        if not t:
-            raise ValueError("Empty time string")
+    # Remove fractional seconds by taking everything before the first '.'
+    t = t.partition(".")[0]
 
-        # Remove fractional seconds by splitting on '.' and taking the first part
-        t = t.split(".")[0]
-        parts = [int(x) for x in t.split(":")]
+    # Slice around the colon positions rather than building a list of parts
+    first = t.find(":")
+    if first < 0:
+        raise ValueError(f"Invalid time format: {t}")
+    second = t.find(":", first + 1)
+    if second < 0:
+        return int(t[:first]) * 60 + int(t[first + 1 :])
+    if t.find(":", second + 1) < 0:
+        return (
+            int(t[:first]) * 3600
+            + int(t[first + 1 : second]) * 60
+            + int(t[second + 1 :])
+        )
 
-        if len(parts) == 2:
-            return timedelta(minutes=parts[0], seconds=parts[1])
-        if len(parts) == 3:
-            return timedelta(hours=parts[0], minutes=parts[1], seconds=parts[2])
+    raise ValueError(f"Invalid time format: {t}")
 
-        raise ValueError(f"Invalid time format: {t}")
 
-    def format_time(self, td: timedelta) -> str:
-        """Convert timedelta to 'HH:MM:SS' format."""
-        total_seconds = int(td.total_seconds())
-        h, remainder = divmod(total_seconds, 3600)
-        m, s = divmod(remainder, 60)
-        return f"{h:02d}:{m:02d}:{s:02d}"
+@lru_cache(maxsize=4096)
+def _format_seconds(seconds: int) -> str:
+    """Convert a whole number of seconds to 'HH:MM:SS' format."""
+    h, remainder = divmod(seconds, 3600)
+    m, s = divmod(remainder, 60)
+    return f"{h:02d}:{m:02d}:{s:02d}"
 
-    def apply_timing_rules(
-        self,
-        tracks: list[DomainTrack],
-        total_duration: timedelta,
-        intro_outro_threshold: timedelta = timedelta(seconds=30),
-        min_gap_threshold: timedelta = timedelta(seconds=60),
-    ) -> list[DomainTrack]:
-        """
-        Apply timing rules to a list of tracks.
-
-        Args:
-            tracks: List of domain tracks to process.
-            total_duration: Total duration of the tracklist.
-            intro_outro_threshold: Threshold for adding intro/outro tracks.
-                If gap is <= threshold, extend the track; if > threshold, add ID track.
-                Defaults to 30 seconds.
-            min_gap_threshold: Minimum gap between tracks to insert an ID track.
-                Gaps <= this threshold will be adjusted to midpoint.
-                Defaults to 60 seconds.
-
-        Returns:
-            Processed list of tracks with timing rules applied.
-        """
-        if not tracks:
-            return tracks
-
-        logger.info(
-            f"Applying timing rules to {len(tracks)} tracks "
-            f"(total_duration={total_duration}, "
-            f"intro_outro_threshold={intro_outro_threshold}, "
-            f"min_gap_threshold={min_gap_threshold})"
-        )
 
-        # Sort and deduplicate
-        tracks = sorted(tracks, key=lambda t: self.parse_time(t.start_time))
-        tracks = self._deduplicate_tracks(tracks)
+def parse_time(t: str) -> timedelta:
+    """Convert 'H:MM:SS' or 'MM:SS' string to timedelta."""
+    return timedelta(seconds=_to_seconds(t))
 
-        # Add intro ID track if needed
-        tracks = self._add_intro_track(tracks, threshold=intro_outro_threshold)
 
-        # Process gaps between tracks
-        tracks = self._process_gaps(tracks, min_gap=min_gap_threshold)
+def format_time(td: timedelta) -> str:
+    """Convert timedelta to 'HH:MM:SS' format."""
+    return _format_seconds(int(td.total_seconds()))
 
-        # Add outro track if needed (handles missing end_time for last track)
-        tracks = self._add_outro_track(
-            tracks, total_duration, threshold=intro_outro_threshold
-        )
 
-        # Renumber sequentially
-        for i, track in enumerate(tracks, start=1):
-            track.track_number = i
+def apply_timing_rules(
+    tracks: list[DomainTrack],
+    total_duration: timedelta,
+    intro_outro_threshold: timedelta = timedelta(seconds=30),
+    min_gap_threshold: timedelta = timedelta(seconds=60),
+) -> list[DomainTrack]:
+    """
+    Apply timing rules to a list of tracks.
 
-        # Normalise all time strings to HH:MM:SS format
-        for track in tracks:
-            if track.start_time:
-                track.start_time = self.format_time(self.parse_time(track.start_time))
-            if track.end_time:
-                track.end_time = self.format_time(self.parse_time(track.end_time))
+    Args:
+        tracks: List of domain tracks to process.
+        total_duration: Total duration of the tracklist.
+        intro_outro_threshold: Threshold for adding intro/outro tracks.
+            If gap is <= threshold, extend the track; if > threshold, add ID track.
+            Defaults to 30 seconds.
+        min_gap_threshold: Minimum gap between tracks to insert an ID track.
+            Gaps <= this threshold will be adjusted to midpoint.
+            Defaults to 60 seconds.
 
+    Returns:
+        Processed list of tracks with timing rules applied.
+    """
+    if not tracks:
         return tracks
 
-    def _deduplicate_tracks(self, tracks: list[DomainTrack]) -> list[DomainTrack]:
-        """Remove duplicate tracks (same artist + title), merging timing ranges."""
-        if not tracks:
-            return tracks
+    logger.info(
+        f"Applying timing rules to {len(tracks)} tracks "
+        f"(total_duration={total_duration}, "
+        f"intro_outro_threshold={intro_outro_threshold}, "
+        f"min_gap_threshold={min_gap_threshold})"
+    )
+
+    # All timing math below works on whole seconds
+    total_seconds = int(total_duration.total_seconds())
+    intro_outro_seconds = int(intro_outro_threshold.total_seconds())
+    min_gap_seconds = int(min_gap_threshold.total_seconds())
+
+    # Sort and deduplicate
+    tracks = sorted(tracks, key=lambda t: _to_seconds(t.start_time))
+    tracks = _deduplicate_tracks(tracks)
+
+    # Add intro ID track if needed
+    tracks = _add_intro_track(tracks, threshold=intro_outro_seconds)
+
+    # Process gaps between tracks
+    tracks = _process_gaps(tracks, min_gap=min_gap_seconds)
+
+    # Add outro track if needed (handles missing end_time for last track)
+    tracks = _add_outro_track(tracks, total_seconds, threshold=intro_outro_seconds)
+
+    # Renumber sequentially
+    for i, track in enumerate(tracks, start=1):
+        track.track_number = i
+
+    # Normalise all time strings to HH:MM:SS format. Most are already
+    # canonical by now, so only assign (and re-validate) the ones that change
+    for track in tracks:
+        if track.start_time:
+            start_time = _format_seconds(_to_seconds(track.start_time))
+            if start_time != track.start_time:
+                track.start_time = start_time
+        if track.end_time:
+            end_time = _format_seconds(_to_seconds(track.end_time))
+            if end_time != track.end_time:
+                track.end_time = end_time
+
+    return tracks
+
+
+def _deduplicate_tracks(tracks: list[DomainTrack]) -> list[DomainTrack]:
+    """Remove duplicate tracks (same artist + title), merging timing ranges."""
+    if not tracks:
+        return tracks
 
-        seen: dict[tuple[str, str], DomainTrack] = {}
-        deduped: list[DomainTrack] = []
+    seen: dict[tuple[str, str], DomainTrack] = {}
+    merged_ranges: dict[tuple[str, str], tuple[int, int]] = {}
+    deduped: list[DomainTrack] = []
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
 
-        for track in tracks:
-            key = (track.artist.lower().strip(), track.name.lower().strip())
+    for track in tracks:
+        key = (
+            (track.artist or "").lower().strip(),
+            (track.name or "").lower().strip(),
+        )
 
-            if key not in seen:
-                seen[key] = track
-                deduped.append(track)
-                continue
+        existing = seen.get(key)
+        if existing is None:
+            seen[key] = track
+            deduped.append(track)
+            continue
 
-            existing = seen[key]
-            existing_start = self.parse_time(existing.start_time)
+        if key in merged_ranges:
+            existing_start, existing_end = merged_ranges[key]
+        else:
+            existing_start = _to_seconds(existing.start_time)
             existing_end = (
-                self.parse_time(existing.end_time)
-                if existing.end_time
-                else existing_start
-            )
-            current_start = self.parse_time(track.start_time)
-            current_end = (
-                self.parse_time(track.end_time) if track.end_time else current_start
+                _to_seconds(existing.end_time) if existing.end_time else existing_start
             )
+        current_start = _to_seconds(track.start_time)
+        current_end = _to_seconds(track.end_time) if track.end_time else current_start
 
-            merged_start = min(existing_start, current_start)
-            merged_end = max(existing_end, current_end)
-            existing.start_time = self.format_time(merged_start)
-            existing.end_time = self.format_time(merged_end)
+        merged_start = min(existing_start, current_start)
+        merged_end = max(existing_end, current_end)
+        merged_ranges[key] = (merged_start, merged_end)
 
+        if debug_enabled:
             logger.debug(
                 f"Merged duplicate track: {track.artist} - {track.name} "
-                f"({existing.start_time} -> {existing.end_time})"
+                f"({_format_seconds(merged_start)} -> {_format_seconds(merged_end)})"
             )
 
-        return deduped
+    # Write each merged range back once per surviving track
+    for key, (merged_start, merged_end) in merged_ranges.items():
+        seen[key].start_time = _format_seconds(merged_start)
+        seen[key].end_time = _format_seconds(merged_end)
 
-    def _add_intro_track(
-        self, tracks: list[DomainTrack], threshold: timedelta = timedelta(seconds=30)
-    ) -> list[DomainTrack]:
-        """
-        Add an intro track if the first track starts after the threshold.
-        Otherwise, edit the first track to start at 00:00:00.
-        """
-        if not tracks or self.parse_time(tracks[0].start_time) < threshold:
-            tracks[0].start_time = self.format_time(timedelta(seconds=0))
-            return tracks
-
-        intro_track = DomainTrack(
-            name="ID",
-            artist="ID",
-            start_time=self.format_time(timedelta(seconds=0)),
-            end_time=tracks[0].start_time,
-        )
-        tracks.insert(0, intro_track)
-        logger.debug(f"Inserted intro ID track: 00:00 -> {intro_track.end_time}")
+    return deduped
+
+
+def _add_intro_track(
+    tracks: list[DomainTrack], threshold: int = 30
+) -> list[DomainTrack]:
+    """
+    Add an intro track if the first track starts after the threshold
+    (in seconds). Otherwise, edit the first track to start at 00:00:00.
+    """
+    if not tracks or _to_seconds(tracks[0].start_time) < threshold:
+        tracks[0].start_time = _format_seconds(0)
         return tracks
 
-    def _add_outro_track(
-        self,
-        tracks: list[DomainTrack],
-        total_duration: timedelta,
-        threshold: timedelta = timedelta(seconds=30),
-    ) -> list[DomainTrack]:
-        """
-        Add an outro track if the last track ends before the total duration
-        the difference is greater than the threshold.
-        Otherwise, edit the last track to end at the total duration.
-        Handles missing end_time for the last track by setting it to total_duration.
-        """
-        if not tracks:
-            return tracks
-
-        if not tracks[-1].end_time:
-            tracks[-1].end_time = self.format_time(total_duration)
-            logger.debug("Filled last track end_time from total_duration")
-            return tracks
-
-        last_end = self.parse_time(tracks[-1].end_time)
-        if last_end >= total_duration:
-            return tracks
-
-        if last_end + threshold >= total_duration:
-            tracks[-1].end_time = self.format_time(total_duration)
-            return tracks
-
-        outro_track = DomainTrack(
-            name="ID",
-            artist="ID",
-            start_time=self.format_time(last_end),
-            end_time=self.format_time(total_duration),
-        )
-        tracks.append(outro_track)
-        logger.debug(
-            f"Inserted outro ID track: {outro_track.start_time} -> {outro_track.end_time}"
-        )
+    intro_track = DomainTrack(
+        name="ID",
+        artist="ID",
+        start_time=_format_seconds(0),
+        end_time=tracks[0].start_time,
+    )
+    tracks.insert(0, intro_track)
+    logger.debug(f"Inserted intro ID track: 00:00 -> {intro_track.end_time}")
+    return tracks
+
+
+def _add_outro_track(
+    tracks: list[DomainTrack],
+    total_duration: int,
+    threshold: int = 30,
+) -> list[DomainTrack]:
+    """
+    Add an outro track if the last track ends before the total duration
+    the difference is greater than the threshold (both in seconds).
+    Otherwise, edit the last track to end at the total duration.
+    Handles missing end_time for the last track by setting it to total_duration.
+    """
+    if not tracks:
         return tracks
 
-    def _process_gaps(
-        self, tracks: list[DomainTrack], min_gap: timedelta = timedelta(seconds=60)
-    ) -> list[DomainTrack]:
-        """
-        Process gaps between tracks.
-        Sets missing end_times for tracks based on the next track's start_time.
-        If the gap is longer than min_gap, insert an ID track.
-        If the gap is shorter than min_gap, adjust the previous
-        end time and the next start time to the midpoint of the gap.
-        """
-        adjusted_tracks = []
-
-        for i, track in enumerate(tracks):
-            # Set missing end_time
-            if not track.end_time and i < len(tracks) - 1:
-                track.end_time = tracks[i + 1].start_time
+    total_duration_str = _format_seconds(total_duration)
+
+    if not tracks[-1].end_time:
+        tracks[-1].end_time = total_duration_str
+        logger.debug("Filled last track end_time from total_duration")
+        return tracks
+
+    last_end = _to_seconds(tracks[-1].end_time)
+    if last_end >= total_duration:
+        return tracks
+
+    if last_end + threshold >= total_duration:
+        tracks[-1].end_time = total_duration_str
+        return tracks
+
+    outro_track = DomainTrack(
+        name="ID",
+        artist="ID",
+        start_time=_format_seconds(last_end),
+        end_time=total_duration_str,
+    )
+    tracks.append(outro_track)
+    logger.debug(
+        f"Inserted outro ID track: {outro_track.start_time} -> {outro_track.end_time}"
+    )
+    return tracks
+
+
+def _process_gaps(tracks: list[DomainTrack], min_gap: int = 60) -> list[DomainTrack]:
+    """
+    Process gaps between tracks.
+    Sets missing end_times for tracks based on the next track's start_time.
+    If the gap is longer than min_gap seconds, insert an ID track.
+    If the gap is shorter than min_gap, adjust the previous
+    end time and the next start time to the midpoint of the gap.
+
+    Timings are worked on as parallel lists of seconds and only written
+    back to the tracks that changed, since every assignment on a
+    DomainTrack goes through pydantic validation.
+    """
+    if not tracks:
+        return tracks
+
+    starts = [_to_seconds(track.start_time) for track in tracks]
+    ends = [_to_seconds(track.end_time) if track.end_time else None for track in tracks]
+    original_starts = list(starts)
+    original_ends = list(ends)
+
+    last = len(tracks) - 1
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
+
+    # Set missing end_times from the next track's start_time
+    for i in range(last):
+        if ends[i] is None:
+            ends[i] = starts[i + 1]
+            if debug_enabled:
                 logger.debug(f"Filled missing end_time for track {i + 1}")
 
-            adjusted_tracks.append(track)
+    # A midpoint adjustment only moves the two edges of its own gap, so
+    # every gap can be computed up front
+    gaps = [starts[i + 1] - ends[i] for i in range(last)]
 
-            if i == len(tracks) - 1:
-                # Last track, no gap to process
-                continue
+    adjusted_tracks: list[DomainTrack] = []
 
-            start = self.parse_time(track.start_time)
-            end = self.parse_time(track.end_time) if track.end_time else start
-            next_track = tracks[i + 1]
-            next_start = self.parse_time(next_track.start_time)
-            gap = next_start - end
+    for i, track in enumerate(tracks):
+        adjusted_tracks.append(track)
 
-            if gap < timedelta(seconds=0):
-                logger.warning(
-                    f"Overlap detected: {track.artist} → {next_track.artist} ({abs(gap)} overlap)"
-                )
-                continue
-
-            if gap > min_gap:
-                # Insert ID track for long gap
-                id_track = DomainTrack(
-                    track_number=None,
-                    name="ID",
-                    artist="ID",
-                    start_time=self.format_time(end),
-                    end_time=self.format_time(next_start),
-                )
-                adjusted_tracks.append(id_track)
+        if i == last:
+            # Last track, no gap to process
+            continue
+
+        next_track = tracks[i + 1]
+        gap = gaps[i]
+
+        if gap < 0:
+            logger.warning(
+                f"Overlap detected: {track.artist} → {next_track.artist} "
+                f"({timedelta(seconds=-gap)} overlap)"
+            )
+            continue
+
+        if gap > min_gap:
+            # Insert ID track for long gap
+            id_track = DomainTrack(
+                track_number=None,
+                name="ID",
+                artist="ID",
+                start_time=_format_seconds(ends[i]),
+                end_time=_format_seconds(starts[i + 1]),
+            )
+            adjusted_tracks.append(id_track)
+            if debug_enabled:
                 logger.debug(
-                    f"Inserted gap ID track: {id_track.start_time} → {id_track.end_time} (gap={gap})"
+                    f"Inserted gap ID track: {id_track.start_time} → {id_track.end_time} "
+                    f"(gap={timedelta(seconds=gap)})"
                 )
 
-            elif gap > timedelta(seconds=0):
-                midpoint = end + gap / 2
-                midpoint_str = self.format_time(midpoint)
-
-                # Adjust previous end & next start
-                adjusted_tracks[-1].end_time = midpoint_str
-                next_track.start_time = midpoint_str
+        elif gap > 0:
+            midpoint = ends[i] + gap // 2
+            ends[i] = midpoint
+            starts[i + 1] = midpoint
+            if debug_enabled:
                 logger.debug(
-                    f"Adjusted short gap ({gap}): midpoint {midpoint_str} "
+                    f"Adjusted short gap ({timedelta(seconds=gap)}): midpoint "
+                    f"{_format_seconds(midpoint)} "
                     f"between '{track.name}' and '{next_track.name}'"
                 )
 
-        return adjusted_tracks
+    # Write back only the timings that actually changed
+    for i, track in enumerate(tracks):
+        if starts[i] != original_starts[i]:
+            track.start_time = _format_seconds(starts[i])
+        if ends[i] != original_ends[i]:
+            track.end_time = _format_seconds(ends[i])
+
+    return adjusted_tracks
+
+
+class TimingUtils:
+    """Utility class for handling timing operations and track alignment.
+
+    Thin wrapper over the module-level functions, kept for existing callers.
+    """
+
+    __slots__ = ()
+
+    def parse_time(self, t: str) -> timedelta:
+        """Convert 'H:MM:SS' or 'MM:SS' string to timedelta."""
+        return parse_time(t)
+
+    def format_time(self, td: timedelta) -> str:
+        """Convert timedelta to 'HH:MM:SS' format."""
+        return format_time(td)
+
+    def apply_timing_rules(
+        self,
+        tracks: list[DomainTrack],
+        total_duration: timedelta,
+        intro_outro_threshold: timedelta = timedelta(seconds=30),
+        min_gap_threshold: timedelta = timedelta(seconds=60),
+    ) -> list[DomainTrack]:
+        """Apply timing rules to a list of tracks. See `apply_timing_rules`."""
+        return apply_timing_rules(
+            tracks, total_duration, intro_outro_threshold, min_gap_threshold
+        )
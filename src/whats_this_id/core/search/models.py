@@ -1,7 +1,8 @@
-from pydantic import BaseModel
+from dataclasses import dataclass
 
 
-class SearchResult(BaseModel):
+@dataclass(slots=True, frozen=True)
+class SearchResult:
     """Represents a single search result."""
 
     link: str
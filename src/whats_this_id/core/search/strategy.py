@@ -2,6 +2,7 @@
 Search strategies and result models.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
 
 from dj_set_downloader import DomainTracklist
@@ -21,3 +22,19 @@ class SearchStrategy(ABC):
     def get_tracklist(self, url: str) -> tuple[DomainTracklist, str]:
         """Get a tracklist from the given URL."""
         pass
+
+    async def asearch(self, query: str) -> list[SearchResult]:
+        """Search without blocking the event loop.
+
+        Runs the blocking `search` in a worker thread; strategies with a
+        native async client can override this.
+        """
+        return await asyncio.to_thread(self.search, query)
+
+    async def aget_tracklist(self, url: str) -> tuple[DomainTracklist, str]:
+        """Get a tracklist without blocking the event loop.
+
+        Runs the blocking `get_tracklist` in a worker thread; strategies with a
+        native async client can override this.
+        """
+        return await asyncio.to_thread(self.get_tracklist, url)
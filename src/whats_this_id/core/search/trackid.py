@@ -1,15 +1,32 @@
+from functools import lru_cache
+
 from dj_set_downloader import DomainTrack, DomainTracklist
+from pydantic import TypeAdapter
 from trackidnet import client
 
-from whats_this_id.core.parsers.timing_utils import TimingUtils
-from whats_this_id.core.search.strategy import SearchResult, SearchStrategy
+from whats_this_id.core.parsers.timing_utils import apply_timing_rules, parse_time
+from whats_this_id.core.search.models import SearchResult
+from whats_this_id.core.search.strategy import SearchStrategy
+
+# Validates a whole tracklist in one call instead of one model per track
+_TRACKS_ADAPTER = TypeAdapter(list[DomainTrack])
+
+
+@lru_cache(maxsize=1)
+def get_trackidnet_client() -> client.TrackIDNet:
+    """Return the process-wide trackid.net client.
+
+    The client wraps a pooled httpx.Client, so sharing one keeps
+    connections alive across strategy instances and requests.
+    """
+    return client.TrackIDNet()
 
 
 class TrackIDNetSearchStrategy(SearchStrategy):
     """Search strategy for finding tracklists on trackid.net."""
 
     def __init__(self):
-        self.trackidnet = client.TrackIDNet()
+        self.trackidnet = get_trackidnet_client()
 
     def search(self, query: str) -> list[SearchResult]:
         result = self.trackidnet.search_tracklist(query)
@@ -20,22 +37,21 @@ class TrackIDNetSearchStrategy(SearchStrategy):
 
     def get_tracklist(self, slug: str) -> tuple[DomainTracklist, str]:
         result = self.trackidnet.get_tracklist(slug)
-        timing_utils = TimingUtils()
-        tracks = [
-            DomainTrack(
-                track_number=i + 1,
-                name=track.title,
-                artist=track.artist,
-                start_time=track.start_time,
-                end_time=track.end_time,
-            )
-            for i, track in enumerate(result.tracks)
-        ]
-        tracklist = DomainTracklist(name=result.name, tracks=tracks, artist="unknown")
-        total_duration = timing_utils.parse_time(result.duration)
-        tracklist.tracks = timing_utils.apply_timing_rules(
-            tracklist.tracks, total_duration
+        tracks = _TRACKS_ADAPTER.validate_python(
+            [
+                {
+                    "track_number": i + 1,
+                    "name": track.title,
+                    "artist": track.artist,
+                    "start_time": track.start_time,
+                    "end_time": track.end_time,
+                }
+                for i, track in enumerate(result.tracks)
+            ]
         )
+        tracklist = DomainTracklist(name=result.name, tracks=tracks, artist="unknown")
+        total_duration = parse_time(result.duration)
+        tracklist.tracks = apply_timing_rules(tracklist.tracks, total_duration)
         return tracklist, result.url
 
 
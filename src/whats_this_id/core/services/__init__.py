@@ -1,9 +1,21 @@
 """Core services for the What's This ID application."""
 
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 from .djset_processor import DJSetProcessorService
-from .metadata_extractor import MetadataExtractor, extract_metadata
 from .search_service import SearchService, search_service
 
+if TYPE_CHECKING:
+    from .metadata_extractor import MetadataExtractor, extract_metadata
+
+# Names resolved on first access (PEP 562) so importing the package does not
+# pull in langchain/OpenAI until metadata extraction is actually used
+_LAZY_ATTRIBUTES = {
+    "MetadataExtractor": ".metadata_extractor",
+    "extract_metadata": ".metadata_extractor",
+}
+
 __all__ = [
     "DJSetProcessorService",
     "MetadataExtractor",
@@ -11,3 +23,17 @@ __all__ = [
     "extract_metadata",
     "search_service",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
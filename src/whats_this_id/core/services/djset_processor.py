@@ -2,9 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import tempfile
+import time
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from http import HTTPStatus
-from pathlib import Path
+from typing import IO
 
 from dj_set_downloader import (
     ApiClient,
@@ -22,8 +27,30 @@ from dj_set_downloader import (
 # Constants for ZIP file validation
 ZIP_SIGNATURE_1 = b"PK\x03\x04"  # Standard ZIP file signature
 ZIP_SIGNATURE_2 = b"PK\x05\x06"  # Empty ZIP file signature
+ZIP_SIGNATURES = (ZIP_SIGNATURE_1, ZIP_SIGNATURE_2)  # Checked in a single call
 MIN_ZIP_SIZE = 4  # Minimum bytes needed to validate ZIP signature
 
+# Constants for streaming downloads
+DOWNLOAD_CHUNK_SIZE = 64 * 1024  # Bytes read from the response per chunk
+ZIP_SPOOL_MAX_MEMORY_SIZE = 32 * 1024 * 1024  # Larger archives spill to disk
+MAX_CONCURRENT_DOWNLOADS = 4  # Stays within the API client's connection pool
+
+# How long a healthy health check result is reused, in seconds
+HEALTH_CHECK_TTL_SECONDS = 30
+
+# MIME types for downloadable files, keyed by lower-case extension
+MIME_TYPES = {
+    ".mp3": "audio/mpeg",
+    ".m4a": "audio/mp4",
+    ".wav": "audio/wav",
+    ".flac": "audio/flac",
+    ".zip": "application/zip",
+}
+DEFAULT_MIME_TYPE = "application/octet-stream"
+
+# Units for human readable file sizes, in steps of 1024
+FILE_SIZE_UNITS = ("B", "KB", "MB", "GB")
+
 logger = logging.getLogger(__name__)
 
 
@@ -37,17 +64,31 @@ class DJSetProcessorService:
         self.process_api = ProcessApi(self.api_client)
         self.jobs_api = JobsApi(self.api_client)
         self.downloads_api = DownloadsApi(self.api_client)
+        self._last_healthy: tuple[float, str] | None = None
 
     def check_health(self) -> tuple[bool, str]:
         """Check if the DJ set processor service is healthy.
 
+        A healthy result is reused for HEALTH_CHECK_TTL_SECONDS; unhealthy
+        results are never cached, so recovery is noticed on the next check.
+
         Returns:
             Tuple of (is_healthy, message)
         """
+        last_healthy = self._last_healthy
+        if (
+            last_healthy is not None
+            and time.monotonic() - last_healthy[0] < HEALTH_CHECK_TTL_SECONDS
+        ):
+            return True, last_healthy[1]
+
+        self._last_healthy = None
         try:
             health = self.system_api.health_get()
             if health.status in ["healthy", "ok"]:
-                return True, f"Service is healthy: {health.status}"
+                message = f"Service is healthy: {health.status}"
+                self._last_healthy = (time.monotonic(), message)
+                return True, message
             else:
                 return False, f"Service unhealthy: {health.status}"
         except Exception as e:
@@ -83,6 +124,42 @@ class DJSetProcessorService:
             error_msg = f"Error submitting processing job: {e}"
             return False, error_msg, None
 
+    def submit_processing_job_if_healthy(
+        self,
+        dj_set_url: str,
+        tracklist: DomainTracklist,
+        file_extension: str = "mp3",
+        max_concurrent_tasks: int = 5,
+    ) -> tuple[bool, str, str | None]:
+        """Check service health and submit a processing job concurrently.
+
+        The job is submitted optimistically alongside the health check, so
+        the two round-trips overlap. If the service turns out to be
+        unhealthy, a job it accepted anyway is cancelled.
+
+        Returns:
+            Tuple of (success, message, job_id); message is the health
+            message if the service is unhealthy
+        """
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            health = executor.submit(self.check_health)
+            submission = executor.submit(
+                self.submit_processing_job,
+                dj_set_url,
+                tracklist,
+                file_extension,
+                max_concurrent_tasks,
+            )
+            is_healthy, health_message = health.result()
+            success, message, job_id = submission.result()
+
+        if not is_healthy:
+            if job_id is not None:
+                self.cancel_job(job_id)
+            return False, health_message, None
+
+        return success, message, job_id
+
     def get_job_status(self, job_id: str) -> JobStatus | None:
         """Get the status of a processing job.
 
@@ -112,28 +189,48 @@ class DJSetProcessorService:
             logger.warning(f"Error canceling job: {e}")
             return False
 
-    def download_all_tracks(self, job_id: str) -> tuple[bytearray, str] | None:
+    def download_all_tracks(self, job_id: str) -> tuple[IO[bytes], str] | None:
         """Download all tracks as ZIP with proper error handling.
 
+        The archive is streamed into a spooled temporary file rather than
+        loaded into memory at once, and rejected as soon as its first bytes
+        show it is not a ZIP file.
+
         Returns:
-            Tuple of (file_data, filename) if successful, None if failed
+            Tuple of (file_data, filename) if successful, None if failed.
+            file_data is positioned at the start of the archive.
         """
+        file_data = None
         try:
-            response = self.downloads_api.api_jobs_id_download_get_with_http_info(
-                job_id
+            response = (
+                self.downloads_api.api_jobs_id_download_get_without_preload_content(
+                    job_id
+                )
             )
-            if response.status_code != HTTPStatus.OK:
-                return None
+            try:
+                if response.status != HTTPStatus.OK:
+                    return None
 
-            filename = "tracks.zip"
+                header = response.read(MIN_ZIP_SIZE)
+                if not self._is_valid_zip_file(header):
+                    return None
 
-            if not self._is_valid_zip_file(response.data):
-                return None
+                file_data = tempfile.SpooledTemporaryFile(
+                    max_size=ZIP_SPOOL_MAX_MEMORY_SIZE
+                )
+                file_data.write(header)
+                for chunk in response.stream(DOWNLOAD_CHUNK_SIZE):
+                    file_data.write(chunk)
+            finally:
+                response.release_conn()
 
-            return response.data, filename
+            file_data.seek(0)
+            return file_data, "tracks.zip"
 
         except Exception as e:
-            logger.warning(f"Error downloading single track: {e}")
+            if file_data is not None:
+                file_data.close()
+            logger.warning(f"Error downloading tracks: {e}")
             return None
 
     def download_single_track(
@@ -158,6 +255,47 @@ class DJSetProcessorService:
             logger.warning(f"Error downloading single track: {e}")
             return None
 
+    def download_tracks(
+        self,
+        job_id: str,
+        track_numbers: Iterable[int],
+        file_extension: str = "mp3",
+    ) -> dict[int, tuple[bytearray, str] | None]:
+        """Download several track files concurrently.
+
+        Each track is fetched with `download_single_track` on a small thread
+        pool that shares the API client's connection pool.
+
+        Returns:
+            Mapping of track number to (file_data, filename), or None for
+            tracks that failed to download
+        """
+        track_numbers = list(track_numbers)
+        if not track_numbers:
+            return {}
+
+        with ThreadPoolExecutor(
+            max_workers=min(MAX_CONCURRENT_DOWNLOADS, len(track_numbers))
+        ) as executor:
+            results = executor.map(
+                lambda number: self.download_single_track(
+                    job_id, number, file_extension
+                ),
+                track_numbers,
+            )
+            return dict(zip(track_numbers, results))
+
+    async def adownload_tracks(
+        self,
+        job_id: str,
+        track_numbers: Iterable[int],
+        file_extension: str = "mp3",
+    ) -> dict[int, tuple[bytearray, str] | None]:
+        """Async variant of `download_tracks` for callers on an event loop."""
+        return await asyncio.to_thread(
+            self.download_tracks, job_id, track_numbers, file_extension
+        )
+
     def get_tracks_info(self, job_id: str) -> JobTracksInfoResponse | None:
         """Get detailed track information for a completed job.
 
@@ -182,7 +320,7 @@ class DJSetProcessorService:
         if not file_data or len(file_data) < MIN_ZIP_SIZE:
             return False
 
-        return file_data[:4] == ZIP_SIGNATURE_1 or file_data[:4] == ZIP_SIGNATURE_2
+        return file_data.startswith(ZIP_SIGNATURES)
 
     @staticmethod
     def get_mime_type(filename: str) -> str:
@@ -191,15 +329,11 @@ class DJSetProcessorService:
         Returns:
             MIME type string
         """
-        extension = Path(filename).suffix.lower()
-        mime_types = {
-            ".mp3": "audio/mpeg",
-            ".m4a": "audio/mp4",
-            ".wav": "audio/wav",
-            ".flac": "audio/flac",
-            ".zip": "application/zip",
-        }
-        return mime_types.get(extension, "application/octet-stream")
+        # Same suffix rules as Path.suffix, without building a path object
+        name = filename[filename.rfind("/") + 1 :]
+        dot = name.rfind(".")
+        extension = name[dot:].lower() if 0 < dot < len(name) - 1 else ""
+        return MIME_TYPES.get(extension, DEFAULT_MIME_TYPE)
 
     @staticmethod
     def format_file_size(size_bytes: int) -> str:
@@ -211,12 +345,6 @@ class DJSetProcessorService:
         if size_bytes == 0:
             return "0 B"
 
-        size_names = ["B", "KB", "MB", "GB"]
-        i = 0
-        size = float(size_bytes)
-
-        while size >= 1024 and i < len(size_names) - 1:
-            size /= 1024.0
-            i += 1
-
-        return f"{size:.1f} {size_names[i]}"
+        # Each unit is 2**10 larger, so the unit index follows from the bit length
+        i = min((max(size_bytes, 1).bit_length() - 1) // 10, len(FILE_SIZE_UNITS) - 1)
+        return f"{size_bytes / (1 << (10 * i)):.1f} {FILE_SIZE_UNITS[i]}"
@@ -2,8 +2,13 @@
 
 import logging
 import os
+import threading
+from collections import OrderedDict
+from functools import lru_cache
 
 from dotenv import load_dotenv
+from langchain_core.messages import BaseMessage
+from langchain_core.prompts import ChatPromptTemplate
 from langchain_openai import ChatOpenAI
 from pydantic import BaseModel, Field
 
@@ -13,6 +18,12 @@ logger = logging.getLogger(__name__)
 # Load environment variables
 load_dotenv()
 
+# Constants for caching extraction results
+METADATA_CACHE_MAX_ENTRIES = 256  # Oldest titles are evicted beyond this
+
+# Maximum number of LLM requests in flight for a batch extraction
+MAX_CONCURRENT_EXTRACTIONS = 8
+
 
 class ExtractedMetadata(BaseModel):
     """Pydantic model for structured LLM output."""
@@ -23,6 +34,32 @@ class ExtractedMetadata(BaseModel):
     )
 
 
+# Prompt for a single title, with a {tracklist_title} placeholder
+PROMPT_TEMPLATE = """Extract the artist name and year from this DJ set title:
+
+"{tracklist_title}"
+
+Extract only the artist/DJ name and year. If the year is not clearly present or ambiguous, return None for the year field.
+The artist name should be the DJ, not venue or event names.
+A set can be by two or more artists, usually separated by an ampersand (&) or "B2B", "F2F".
+In that case, return all the artists separated by ampersands (&).
+
+Examples:
+- "SHDW @ Boiler Room Berlin 2023" -> artist="SHDW", year=2023
+- "SHDW & Alarico @ Boiler Room Berlin 2023" -> artist="SHDW & Alarico", year=2023
+- "SHDW b2b Alarico @ Boiler Room Berlin 2023" -> artist="SHDW & Alarico", year=2023
+- "SHDW F2F Alarico @ Boiler Room Berlin 2023" -> artist="SHDW & Alarico", year=2023
+"""
+
+# Parsed once at import; each call only substitutes the title
+EXTRACTION_PROMPT = ChatPromptTemplate.from_template(PROMPT_TEMPLATE)
+
+# Extraction results keyed by (model name, normalized title), oldest first.
+# Shared by every Streamlit session thread, so writes go through the lock
+_metadata_cache: OrderedDict[tuple[str, str], ExtractedMetadata] = OrderedDict()
+_metadata_cache_lock = threading.Lock()
+
+
 class MetadataExtractor:
     """Service for extracting metadata from DJ set titles using LLM."""
 
@@ -35,6 +72,7 @@ class MetadataExtractor:
                 "Please set it in your .env file."
             )
 
+        self.model_name = model_name
         self.llm = ChatOpenAI(
             model=model_name,
             temperature=0,
@@ -43,21 +81,13 @@ class MetadataExtractor:
 
     def extract(self, tracklist_title: str) -> ExtractedMetadata:
         """Extract artist name and year from a DJ set title."""
-        prompt = f"""Extract the artist name and year from this DJ set title:
-
-"{tracklist_title}"
-
-Extract only the artist/DJ name and year. If the year is not clearly present or ambiguous, return None for the year field.
-The artist name should be the DJ, not venue or event names.
-A set can be by two or more artists, usually separated by an ampersand (&) or "B2B", "F2F".
-In that case, return all the artists separated by ampersands (&).
+        cache_key = self._cache_key(tracklist_title)
+        cached = _metadata_cache.get(cache_key)
+        if cached is not None:
+            logger.info(f"Using cached metadata for title: {tracklist_title}")
+            return cached.model_copy()
 
-Examples:
-- "SHDW @ Boiler Room Berlin 2023" -> artist="SHDW", year=2023
-- "SHDW & Alarico @ Boiler Room Berlin 2023" -> artist="SHDW & Alarico", year=2023
-- "SHDW b2b Alarico @ Boiler Room Berlin 2023" -> artist="SHDW & Alarico", year=2023
-- "SHDW F2F Alarico @ Boiler Room Berlin 2023" -> artist="SHDW & Alarico", year=2023
-"""
+        prompt = _build_prompt(tracklist_title)
 
         try:
             logger.info(f"Extracting metadata from title: {tracklist_title}")
@@ -65,13 +95,92 @@ Examples:
             logger.info(
                 f"Extracted metadata: artist={result.artist}, year={result.year}"
             )
-            return result
         except Exception as e:
             logger.error(f"Failed to extract metadata: {e}")
             raise
 
+        _cache_result(cache_key, result)
+        return result
+
+    def extract_many(self, tracklist_titles: list[str]) -> list[ExtractedMetadata]:
+        """Extract metadata for several titles, batching the uncached ones.
+
+        Titles missing from the cache are sent to the LLM in one batch with
+        up to MAX_CONCURRENT_EXTRACTIONS requests in flight.
+
+        Returns:
+            Extracted metadata in the same order as the given titles
+        """
+        results: dict[tuple[str, str], ExtractedMetadata] = {}
+        pending: dict[tuple[str, str], str] = {}
+        for tracklist_title in tracklist_titles:
+            cache_key = self._cache_key(tracklist_title)
+            cached = _metadata_cache.get(cache_key)
+            if cached is not None:
+                results[cache_key] = cached
+            elif cache_key not in pending:
+                pending[cache_key] = tracklist_title
+
+        if pending:
+            try:
+                logger.info(f"Extracting metadata for {len(pending)} titles")
+                extracted = self.llm.batch(
+                    [_build_prompt(title) for title in pending.values()],
+                    config={"max_concurrency": MAX_CONCURRENT_EXTRACTIONS},
+                )
+            except Exception as e:
+                logger.error(f"Failed to extract metadata: {e}")
+                raise
+
+            for cache_key, result in zip(pending, extracted):
+                results[cache_key] = result
+                _cache_result(cache_key, result)
+
+        return [
+            results[self._cache_key(tracklist_title)].model_copy()
+            for tracklist_title in tracklist_titles
+        ]
+
+    def _cache_key(self, tracklist_title: str) -> tuple[str, str]:
+        """Key a title by model too, since extractors may use different models."""
+        return self.model_name, _normalize_title(tracklist_title)
+
+
+def _build_prompt(tracklist_title: str) -> list[BaseMessage]:
+    """Build the extraction prompt messages for a single title."""
+    return EXTRACTION_PROMPT.format_messages(tracklist_title=tracklist_title)
+
+
+def _normalize_title(tracklist_title: str) -> str:
+    """Normalize a title so case and whitespace variants share a cache entry."""
+    return " ".join(tracklist_title.lower().split())
+
+
+def _cache_result(cache_key: tuple[str, str], result: ExtractedMetadata) -> None:
+    """Cache a result, evicting the oldest entries beyond the limit."""
+    with _metadata_cache_lock:
+        _metadata_cache[cache_key] = result.model_copy()
+        _metadata_cache.move_to_end(cache_key)
+        while len(_metadata_cache) > METADATA_CACHE_MAX_ENTRIES:
+            _metadata_cache.popitem(last=False)
+
+
+@lru_cache(maxsize=1)
+def get_metadata_extractor() -> MetadataExtractor:
+    """Return the shared extractor, creating it on first use.
+
+    Reusing one extractor keeps a single OpenAI client and its connection
+    pool alive. Creation is retried on the next call if it fails.
+    """
+    return MetadataExtractor()
+
+
+def clear_metadata_cache() -> None:
+    """Drop all cached extraction results."""
+    with _metadata_cache_lock:
+        _metadata_cache.clear()
+
 
 def extract_metadata(tracklist_title: str) -> ExtractedMetadata:
     """Extract metadata from a DJ set title."""
-    extractor = MetadataExtractor()
-    return extractor.extract(tracklist_title)
+    return get_metadata_extractor().extract(tracklist_title)
@@ -1,24 +1,140 @@
 """Search service for tracklist discovery."""
 
+import asyncio
+import logging
+import threading
+import time
+from collections import OrderedDict
+
 from dj_set_downloader import DomainTracklist
 
 from whats_this_id.core.search.models import SearchResult
 from whats_this_id.core.search.strategy import SearchStrategy
 from whats_this_id.core.search.trackid import TrackIDNetSearchStrategy
 
+# Constants for search result caching
+SEARCH_CACHE_TTL_SECONDS = 600  # How long a query's results are reused
+SEARCH_CACHE_MAX_ENTRIES = 128  # Oldest entries are evicted beyond this
+
+# Number of top search results fetched concurrently by afind_tracklist
+SPECULATIVE_FETCH_COUNT = 3
+
+logger = logging.getLogger(__name__)
+
+# Strategy shared by every SearchService created without one
+_default_strategy = TrackIDNetSearchStrategy()
+
 
 class SearchService:
     """Service for managing search operations."""
 
-    def __init__(self, strategy: SearchStrategy = TrackIDNetSearchStrategy()):
-        self._strategy = strategy
+    def __init__(self, strategy: SearchStrategy | None = None):
+        self._strategy = strategy if strategy is not None else _default_strategy
+        self._search_cache: OrderedDict[str, tuple[float, list[SearchResult]]] = (
+            OrderedDict()
+        )
+        # The global instance is shared by every Streamlit session thread
+        self._cache_lock = threading.Lock()
 
     def search(self, query: str) -> list[SearchResult]:
-        return self._strategy.search(query)
+        """Search for tracklists, reusing recent results for the same query."""
+        cached = self._get_cached(query)
+        if cached is not None:
+            return cached
+
+        results = self._strategy.search(query)
+        self._store(query, results)
+        return list(results)
+
+    async def asearch(self, query: str) -> list[SearchResult]:
+        """Async variant of `search`, sharing the same result cache."""
+        cached = self._get_cached(query)
+        if cached is not None:
+            return cached
+
+        results = await self._strategy.asearch(query)
+        self._store(query, results)
+        return list(results)
 
     def get_tracklist(self, url: str) -> tuple[DomainTracklist, str]:
         return self._strategy.get_tracklist(url)
 
+    async def aget_tracklist(self, url: str) -> tuple[DomainTracklist, str]:
+        """Async variant of `get_tracklist`."""
+        return await self._strategy.aget_tracklist(url)
+
+    async def afind_tracklist(
+        self, query: str, max_candidates: int = SPECULATIVE_FETCH_COUNT
+    ) -> tuple[DomainTracklist, str] | None:
+        """Search and return the first non-empty tracklist among the top results.
+
+        The top `max_candidates` results are fetched concurrently, so one slow
+        or failing result does not hold up the others. Fetches still pending
+        once a tracklist is found are cancelled, which stops native async
+        strategies; thread-backed fetches keep running until their request
+        completes, and their results are discarded.
+
+        Returns:
+            Tuple of (tracklist, url) for the first tracklist with tracks,
+            None if no candidate has any
+        """
+        results = await self.asearch(query)
+        tasks = [
+            asyncio.create_task(self.aget_tracklist(result.link))
+            for result in results[:max_candidates]
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                try:
+                    tracklist, url = await next_done
+                except Exception as e:
+                    logger.warning(f"Error fetching tracklist: {e}")
+                    continue
+                if tracklist.tracks:
+                    return tracklist, url
+            return None
+        finally:
+            for task in tasks:
+                task.cancel()
+            # Cancellation only stops native async strategies; fetches running
+            # in a worker thread via to_thread still finish in the executor
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def clear_cache(self) -> None:
+        """Drop all cached search results."""
+        with self._cache_lock:
+            self._search_cache.clear()
+
+    def _get_cached(self, query: str) -> list[SearchResult] | None:
+        """Return a copy of the cached results for a query, if still fresh."""
+        key = self._normalize_query(query)
+        with self._cache_lock:
+            cached = self._search_cache.get(key)
+        if cached and time.monotonic() - cached[0] < SEARCH_CACHE_TTL_SECONDS:
+            return list(cached[1])
+        return None
+
+    def _store(self, query: str, results: list[SearchResult]) -> None:
+        """Cache results for a query, evicting the oldest entries beyond the limit.
+
+        Empty results are not cached, so a query that found nothing is
+        retried on the next search.
+        """
+        if not results:
+            return
+
+        key = self._normalize_query(query)
+        with self._cache_lock:
+            self._search_cache[key] = (time.monotonic(), results)
+            self._search_cache.move_to_end(key)
+            while len(self._search_cache) > SEARCH_CACHE_MAX_ENTRIES:
+                self._search_cache.popitem(last=False)
+
+    @staticmethod
+    def _normalize_query(query: str) -> str:
+        """Normalize a query so case and whitespace variants share a cache entry."""
+        return " ".join(query.lower().split())
+
 
 # Global search service instance
 search_service = SearchService()
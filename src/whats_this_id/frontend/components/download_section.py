@@ -3,17 +3,30 @@
 import streamlit as st
 from dj_set_downloader import JobTracksInfoResponse
 
+from whats_this_id.frontend.config import AppConfig
 from whats_this_id.frontend.services.djset_processor import (
     FrontendDJSetProcessorService,
     djset_processor_service,
 )
 
 
+def _safe_filename(name: str) -> str:
+    """Keep only characters that are safe in a download filename."""
+    return "".join(c for c in name if c.isalnum() or c in (" ", "-", "_")).strip()
+
+
 def _create_download_button(
-    file_data: bytes, filename: str, processor_service, label_prefix: str = "💾 Save"
+    file_data: bytes,
+    filename: str,
+    processor_service: FrontendDJSetProcessorService,
+    label_prefix: str = "💾 Save",
 ) -> None:
     """Create a standardized download button with file size and proper MIME type.
 
+    The button is rendered in the same run that fetched the file and does
+    not rerun the app when clicked, so nothing needs to be kept in session
+    state between runs.
+
     Args:
         file_data: The file data to download
         filename: Name of the file
@@ -26,6 +39,7 @@ def _create_download_button(
         data=file_data,
         file_name=filename,
         mime=processor_service.get_mime_type(filename),
+        on_click="ignore",
         use_container_width=True,
     )
 
@@ -49,43 +63,34 @@ def _render_tracks_download_options(
     tracks_info: JobTracksInfoResponse,
     processor_service: FrontendDJSetProcessorService,
 ) -> None:
-    """Render download options when detailed track info is available."""
-
-    st.markdown("### Download All Tracks")
+    """Render download options when detailed track info is available.
 
-    zip_data_key = f"download_data_{job_id}_zip"
+    Files are fetched only when their prepare button is clicked, so no file
+    data is kept in session state or fetched on other reruns.
+    """
 
-    if zip_data_key in st.session_state:
-        file_data, filename = st.session_state[zip_data_key]
-        _create_download_button(file_data, filename, processor_service)
+    st.markdown("### Download All Tracks")
 
-    else:
-        if st.button("Download All Tracks", use_container_width=True):
-            with st.spinner("Preparing download..."):
-                result = processor_service.download_all_tracks(job_id)
-                if result:
-                    file_data, original_filename = result
-                    if (
-                        hasattr(st.session_state, "tracklist")
-                        and st.session_state.tracklist
-                    ):
-                        tracklist_name = st.session_state.tracklist.name
-                    if tracklist_name:
-                        safe_name = (
-                            "".join(
-                                c
-                                for c in tracklist_name
-                                if c.isalnum() or c in (" ", "-", "_")
-                            )
-                            .strip()
-                            .replace(" ", "_")
-                        )
-                        new_filename = f"{safe_name}.zip"
-                    else:
-                        new_filename = original_filename
-
-                    st.session_state[zip_data_key] = (file_data, new_filename)
-                    st.rerun()
+    tracklist = st.session_state.get("tracklist")
+    safe_name = (
+        _safe_filename(tracklist.name).replace(" ", "_")
+        if tracklist and tracklist.name
+        else ""
+    )
+    zip_filename = f"{safe_name}.zip" if safe_name else "tracks.zip"
+
+    if st.button("Download All Tracks", use_container_width=True):
+        with st.spinner("Preparing download..."):
+            result = processor_service.download_all_tracks(job_id)
+        if result:
+            # st.download_button only takes bytes or a few io types, so the
+            # spooled archive is read once here and closed; Streamlit keeps
+            # its own copy for the browser to fetch
+            file_data, _ = result
+            with file_data:
+                _create_download_button(
+                    file_data.read(), zip_filename, processor_service
+                )
 
     # Individual tracks section
     if not hasattr(tracks_info, "tracks") or not tracks_info.tracks:
@@ -96,7 +101,7 @@ def _render_tracks_download_options(
     for i, track in enumerate(tracks_info.tracks):
         track_name = getattr(track, "name", f"Track {i + 1}")
         file_size = getattr(track, "file_size", 0)
-        track_data_key = f"track_data_{job_id}_{i}"
+        filename = f"{_safe_filename(track_name)}.{AppConfig.DEFAULT_FILE_EXTENSION}"
 
         col1, col2 = st.columns([3, 1])
 
@@ -106,25 +111,11 @@ def _render_tracks_download_options(
                 st.caption(f"Size: {processor_service.format_file_size(file_size)}")
 
         with col2:
-            if track_data_key in st.session_state:
-                file_data, filename = st.session_state[track_data_key]
-                _create_download_button(file_data, filename, processor_service, "💾")
-            else:
-                if st.button("⬇️", key=f"download_{i}", help=f"Download {track_name}"):
-                    with st.spinner(f"Preparing {track_name}..."):
-                        result = processor_service.download_single_track(job_id, i + 1)
-                        if result:
-                            file_data, original_filename = result
-                            ext = (
-                                original_filename.split(".")[-1]
-                                if "." in original_filename
-                                else "mp3"
-                            )
-                            safe_name = "".join(
-                                c
-                                for c in track_name
-                                if c.isalnum() or c in (" ", "-", "_")
-                            ).strip()
-                            filename = f"{safe_name}.{ext}"
-                            st.session_state[track_data_key] = (file_data, filename)
-                            st.rerun()
+            if st.button("⬇️", key=f"download_{i}", help=f"Download {track_name}"):
+                with st.spinner(f"Preparing {track_name}..."):
+                    result = processor_service.download_single_track(job_id, i + 1)
+                if result:
+                    file_data, _ = result
+                    _create_download_button(
+                        bytes(file_data), filename, processor_service, "💾"
+                    )
@@ -4,6 +4,7 @@ import streamlit as st
 from dj_set_downloader.models.domain_tracklist import DomainTracklist
 
 from whats_this_id.frontend.components.download_section import render_download_section
+from whats_this_id.frontend.config import AppConfig
 from whats_this_id.frontend.services.djset_processor import (
     FrontendDJSetProcessorService,
     display_api_error,
@@ -11,6 +12,9 @@ from whats_this_id.frontend.services.djset_processor import (
 )
 from whats_this_id.frontend.state import clear_processing_state
 
+# Job states after which the status no longer changes
+FINISHED_JOB_STATUSES = ("completed", "failed", "cancelled")
+
 
 def _check_service_health(api_service: FrontendDJSetProcessorService) -> bool:
     """Check if the DJ set processor service is healthy and display status."""
@@ -29,11 +33,10 @@ def _submit_processing_job(
     tracklist: DomainTracklist,
     api_service: FrontendDJSetProcessorService,
 ) -> bool:
-    """Submit a new processing job if one isn't already active."""
-    if st.session_state.processing_job_id:
-        return True  # Job already exists
-
-    success, message, job_id = api_service.submit_processing_job(dj_set_url, tracklist)
+    """Check service health and submit a new processing job concurrently."""
+    success, message, job_id = api_service.submit_processing_job_if_healthy(
+        dj_set_url, tracklist
+    )
 
     if success:
         st.session_state.processing_job_id = job_id
@@ -77,7 +80,9 @@ def process_dj_set_with_progress(dj_set_url: str, tracklist: DomainTracklist):
     """Process DJ set with real-time progress updates in Streamlit."""
 
     try:
-        if not _check_service_health(djset_processor_service):
+        if st.session_state.processing_job_id:
+            # Job already exists, only report on the service
+            _check_service_health(djset_processor_service)
             return
 
         _submit_processing_job(dj_set_url, tracklist, djset_processor_service)
@@ -87,9 +92,41 @@ def process_dj_set_with_progress(dj_set_url: str, tracklist: DomainTracklist):
         clear_processing_state()
 
 
-@st.fragment(run_every=2)
-def progress_tracker():
-    """Fragment that updates every 2 seconds to show progress."""
+def _next_poll_interval(status) -> float | None:
+    """Back off polling once progress stalls and stop once the job finishes."""
+    if status.status in FINISHED_JOB_STATUSES:
+        return None
+
+    if status.progress != st.session_state.processing_last_progress:
+        st.session_state.processing_stalled_checks = 0
+    else:
+        st.session_state.processing_stalled_checks += 1
+
+    if (
+        st.session_state.processing_stalled_checks
+        >= AppConfig.PROGRESS_POLL_STALLED_CHECKS
+    ):
+        return AppConfig.PROGRESS_POLL_STALLED_INTERVAL
+    return AppConfig.PROGRESS_POLL_INTERVAL
+
+
+def _update_poll_interval(status) -> None:
+    """Store the next poll interval, rerunning the app if it changed.
+
+    A fragment's auto-refresh interval is only sent when the fragment is
+    rendered in a full app run, so switching interval needs one. There are
+    only two intervals, so this happens when polling backs off, when
+    progress resumes and when the job finishes, not on every check.
+    """
+    interval = _next_poll_interval(status)
+    st.session_state.processing_last_progress = status.progress
+    if interval != st.session_state.processing_poll_interval:
+        st.session_state.processing_poll_interval = interval
+        st.rerun()
+
+
+def _track_progress():
+    """Fetch the job status and render progress."""
     if not st.session_state.processing_job_id:
         st.info("ℹ️ No active processing job")
         return
@@ -99,6 +136,7 @@ def progress_tracker():
             st.session_state.processing_job_id
         )
         st.session_state.processing_status = status
+        _update_poll_interval(status)
         _handle_job_status_update(status, djset_processor_service)
 
     except Exception as e:
@@ -106,6 +144,16 @@ def progress_tracker():
         st.stop()  # Stop auto-refresh on error
 
 
+def progress_tracker():
+    """Fragment that shows progress, polling at the current adaptive interval.
+
+    Polls every PROGRESS_POLL_INTERVAL seconds while progress changes, every
+    PROGRESS_POLL_STALLED_INTERVAL seconds once it has stalled, and stops
+    polling once the job has finished.
+    """
+    st.fragment(_track_progress, run_every=st.session_state.processing_poll_interval)()
+
+
 def _render_processing_status(status, api_service: FrontendDJSetProcessorService):
     """Render the processing status with progress bar and cancel button."""
     progress_value = status.progress / 100.0
@@ -130,7 +178,7 @@ def render_processing_controls():
 
     if st.session_state.processing_job_id:
         st.subheader("Processing Progress", help=f"{st.session_state.dj_set_url}")
-        progress_tracker()  # This will auto-update every 2 seconds
+        progress_tracker()  # Auto-updates until the job finishes
     else:
         st.info("No processing job active")
 
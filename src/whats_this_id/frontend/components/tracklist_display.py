@@ -6,8 +6,6 @@ import pandas as pd
 import streamlit as st
 from dj_set_downloader import DomainTracklist
 
-from whats_this_id.core.services import extract_metadata
-
 logger = logging.getLogger(__name__)
 
 
@@ -64,6 +62,9 @@ def _handle_ai_extraction(tracklist: DomainTracklist) -> None:
     Args:
         tracklist: The tracklist to extract metadata from.
     """
+    # Imported here so the langchain stack only loads when extraction is used
+    from whats_this_id.core.services import extract_metadata
+
     with st.spinner("🤖 Extracting metadata with AI..."):
         try:
             extracted = extract_metadata(tracklist.name)
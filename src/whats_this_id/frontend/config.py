@@ -34,6 +34,11 @@ class AppConfig:
     DEFAULT_FILE_EXTENSION = "m4a"
     DEFAULT_MAX_CONCURRENT_TASKS = 4
 
+    # Progress polling (seconds)
+    PROGRESS_POLL_INTERVAL = 2.0  # While the job is making progress
+    PROGRESS_POLL_STALLED_INTERVAL = 10.0  # Once progress has stalled
+    PROGRESS_POLL_STALLED_CHECKS = 3  # Unchanged checks before backing off
+
     # API
     DEFAULT_API_BASE_URL = "http://localhost:8000"
 
@@ -1,5 +1,7 @@
 """Frontend wrapper for DJ set processor service with UI concerns."""
 
+from typing import IO
+
 import streamlit as st
 from dj_set_downloader import DomainTracklist, JobStatus, JobTracksInfoResponse
 
@@ -34,6 +36,18 @@ class FrontendDJSetProcessorService:
 
         return success, message, job_id
 
+    def submit_processing_job_if_healthy(
+        self,
+        dj_set_url: str,
+        tracklist: DomainTracklist,
+        file_extension: str = AppConfig.DEFAULT_FILE_EXTENSION,
+        max_concurrent_tasks: int = AppConfig.DEFAULT_MAX_CONCURRENT_TASKS,
+    ) -> tuple[bool, str, str | None]:
+        """Check service health and submit a processing job concurrently."""
+        return self._service.submit_processing_job_if_healthy(
+            dj_set_url, tracklist, file_extension, max_concurrent_tasks
+        )
+
     def get_job_status(self, job_id: str) -> JobStatus | None:
         """Get the status of a processing job with UI error handling."""
         try:
@@ -49,7 +63,7 @@ class FrontendDJSetProcessorService:
             st.error("Error canceling job")
         return success
 
-    def download_all_tracks(self, job_id: str) -> tuple[bytearray, str] | None:
+    def download_all_tracks(self, job_id: str) -> tuple[IO[bytes], str] | None:
         """Download all tracks as ZIP with UI error handling."""
         result = self._service.download_all_tracks(job_id)
         if result is None:
@@ -2,6 +2,8 @@
 
 import streamlit as st
 
+from whats_this_id.frontend.config import AppConfig
+
 
 def initialize_session_state():
     """Initialize all session state variables."""
@@ -19,24 +21,21 @@ def initialize_session_state():
         st.session_state.processing_job_id = None
     if "processing_status" not in st.session_state:
         st.session_state.processing_status = None
+    if "processing_poll_interval" not in st.session_state:
+        st.session_state.processing_poll_interval = AppConfig.PROGRESS_POLL_INTERVAL
+    if "processing_last_progress" not in st.session_state:
+        st.session_state.processing_last_progress = None
+    if "processing_stalled_checks" not in st.session_state:
+        st.session_state.processing_stalled_checks = 0
 
 
 def clear_processing_state():
     """Clear processing-related session state."""
     st.session_state.processing_job_id = None
     st.session_state.processing_status = None
-
-
-def clear_download_state():
-    """Clear download-related session state."""
-    # Clear any prepared download data
-    keys_to_remove = []
-    for key in st.session_state.keys():
-        if key.startswith("download_data_") or key.startswith("track_data_"):
-            keys_to_remove.append(key)
-
-    for key in keys_to_remove:
-        del st.session_state[key]
+    st.session_state.processing_poll_interval = AppConfig.PROGRESS_POLL_INTERVAL
+    st.session_state.processing_last_progress = None
+    st.session_state.processing_stalled_checks = 0
 
 
 def update_search_results(search_results):
@@ -45,9 +44,8 @@ def update_search_results(search_results):
     st.session_state.selected_result_index = None
     st.session_state.tracklist = None
     st.session_state.dj_set_url = None
-    # Clear any existing processing/download state when new search is performed
+    # Clear any existing processing state when new search is performed
     clear_processing_state()
-    clear_download_state()
 
 
 def select_search_result(index: int):
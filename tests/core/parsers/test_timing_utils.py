@@ -140,6 +140,32 @@ def test_apply_timing_rules(input_tracks, expected_tracks):
                 ("00:00:00", "00:02:00", "Track 1", "Artist 1"),
             ],
         ),
+        # Three copies should merge into a single range, ignoring case
+        (
+            [
+                DomainTrack(
+                    name="Track 1",
+                    artist="Artist 1",
+                    start_time="00:00:00",
+                    end_time="00:01:00",
+                ),
+                DomainTrack(
+                    name="track 1",
+                    artist="ARTIST 1",
+                    start_time="00:01:00",
+                    end_time="00:02:00",
+                ),
+                DomainTrack(
+                    name="Track 1",
+                    artist="Artist 1",
+                    start_time="00:02:00",
+                    end_time="00:03:00",
+                ),
+            ],
+            [
+                ("00:00:00", "00:03:00", "Track 1", "Artist 1"),
+            ],
+        ),
     ],
 )
 def test_deduplicate_tracks(input_tracks, expected_tracks):
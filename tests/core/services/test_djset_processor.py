@@ -0,0 +1,390 @@
+"""Tests for the DJ set processor service."""
+
+from __future__ import annotations
+
+import io
+import threading
+from typing import TYPE_CHECKING
+
+import pytest
+
+from whats_this_id.core.services.djset_processor import (
+    HEALTH_CHECK_TTL_SECONDS,
+    DJSetProcessorService,
+)
+
+if TYPE_CHECKING:
+    from _pytest.monkeypatch import MonkeyPatch
+    from pytest_mock.plugin import MockerFixture
+
+
+class FakeStreamingResponse:
+    """Minimal stand-in for a urllib3 response read without preloading."""
+
+    def __init__(self, body: bytes, status: int = 200) -> None:
+        self.status = status
+        self._body = io.BytesIO(body)
+        self.released = False
+
+    def read(self, amt: int | None = None) -> bytes:
+        return self._body.read(amt)
+
+    def stream(self, amt: int):
+        while chunk := self._body.read(amt):
+            yield chunk
+
+    def release_conn(self) -> None:
+        self.released = True
+
+
+class TestIsValidZipFile:
+    """Test cases for ZIP signature validation."""
+
+    @pytest.mark.parametrize(
+        "file_data, expected",
+        [
+            (b"PK\x03\x04rest-of-archive", True),
+            (bytearray(b"PK\x03\x04rest-of-archive"), True),
+            (b"PK\x05\x06" + b"\x00" * 18, True),
+            (b"PK\x01\x02central-directory", False),
+            (b"ID3\x04mp3-data", False),
+            (b"PK\x03", False),
+            (b"", False),
+            (None, False),
+        ],
+    )
+    def test_is_valid_zip_file(
+        self, file_data: bytes | bytearray | None, expected: bool
+    ) -> None:
+        """Test ZIP detection for standard, empty, truncated and foreign data.
+
+        Validates that only data starting with a local file header or an
+        end-of-central-directory record is accepted.
+        """
+        service = DJSetProcessorService("http://localhost:8000")
+        assert service._is_valid_zip_file(file_data) is expected
+
+
+class TestFormatFileSize:
+    """Test cases for human readable file sizes."""
+
+    @pytest.mark.parametrize(
+        "size_bytes, expected",
+        [
+            (0, "0 B"),
+            (1, "1.0 B"),
+            (1023, "1023.0 B"),
+            (1024, "1.0 KB"),
+            (1536, "1.5 KB"),
+            (1024**2 - 1, "1024.0 KB"),
+            (15 * 1024**2, "15.0 MB"),
+            (int(2.5 * 1024**3), "2.5 GB"),
+            (2048 * 1024**3, "2048.0 GB"),
+        ],
+    )
+    def test_format_file_size(self, size_bytes: int, expected: str) -> None:
+        """Test formatting at and around each unit boundary.
+
+        Validates that sizes beyond the largest unit stay in GB.
+        """
+        assert DJSetProcessorService.format_file_size(size_bytes) == expected
+
+
+class TestGetMimeType:
+    """Test cases for MIME type lookup."""
+
+    @pytest.mark.parametrize(
+        "filename, expected",
+        [
+            ("track_1.mp3", "audio/mpeg"),
+            ("Track_1.MP3", "audio/mpeg"),
+            ("set.m4a", "audio/mp4"),
+            ("tracks.zip", "application/zip"),
+            ("archive.tar.zip", "application/zip"),
+            ("downloads/track_2.flac", "audio/flac"),
+            (".mp3", "application/octet-stream"),
+            ("track.", "application/octet-stream"),
+            ("track", "application/octet-stream"),
+            ("notes.txt", "application/octet-stream"),
+        ],
+    )
+    def test_get_mime_type(self, filename: str, expected: str) -> None:
+        """Test MIME lookup by extension.
+
+        Validates case-insensitive matching and the octet-stream fallback.
+        """
+        assert DJSetProcessorService.get_mime_type(filename) == expected
+
+
+class TestDownloadAllTracks:
+    """Test cases for streaming the ZIP download."""
+
+    @pytest.fixture
+    def service(self) -> DJSetProcessorService:
+        return DJSetProcessorService("http://localhost:8000")
+
+    def test_streams_valid_zip(
+        self, service: DJSetProcessorService, mocker: MockerFixture
+    ) -> None:
+        """Test that a ZIP response is streamed into a rewound file.
+
+        Validates that the full body is kept and the connection released.
+        """
+        body = b"PK\x03\x04" + b"x" * 200_000
+        response = FakeStreamingResponse(body)
+        mocker.patch.object(
+            service.downloads_api,
+            "api_jobs_id_download_get_without_preload_content",
+            return_value=response,
+        )
+
+        result = service.download_all_tracks("job-1")
+
+        assert result is not None
+        file_data, filename = result
+        assert filename == "tracks.zip"
+        assert file_data.read() == body
+        assert response.released
+
+    @pytest.mark.parametrize(
+        "response",
+        [
+            FakeStreamingResponse(b"ID3\x04not-a-zip"),
+            FakeStreamingResponse(b"PK\x03\x04", status=404),
+        ],
+    )
+    def test_rejects_invalid_response(
+        self,
+        service: DJSetProcessorService,
+        mocker: MockerFixture,
+        response: FakeStreamingResponse,
+    ) -> None:
+        """Test that non-ZIP data and error statuses return None.
+
+        Validates that the connection is released without streaming the body.
+        """
+        mocker.patch.object(
+            service.downloads_api,
+            "api_jobs_id_download_get_without_preload_content",
+            return_value=response,
+        )
+
+        assert service.download_all_tracks("job-1") is None
+        assert response.released
+
+    def test_request_error_returns_none(
+        self, service: DJSetProcessorService, mocker: MockerFixture
+    ) -> None:
+        """Test that a failed request is logged and returns None.
+
+        Validates the error handling around the download call.
+        """
+        mocker.patch.object(
+            service.downloads_api,
+            "api_jobs_id_download_get_without_preload_content",
+            side_effect=Exception("connection refused"),
+        )
+
+        assert service.download_all_tracks("job-1") is None
+
+
+class TestDownloadTracks:
+    """Test cases for concurrent multi-track downloads."""
+
+    def test_downloads_each_track(self, mocker: MockerFixture) -> None:
+        """Test that every requested track is downloaded and keyed by number.
+
+        Validates that failed tracks are reported as None.
+        """
+        service = DJSetProcessorService("http://localhost:8000")
+        mocker.patch.object(
+            service,
+            "download_single_track",
+            side_effect=lambda job_id, number, ext: (
+                None if number == 2 else (bytearray(b"audio"), f"track_{number}.{ext}")
+            ),
+        )
+
+        results = service.download_tracks("job-1", [1, 2, 3], "flac")
+
+        assert results == {
+            1: (bytearray(b"audio"), "track_1.flac"),
+            2: None,
+            3: (bytearray(b"audio"), "track_3.flac"),
+        }
+
+    def test_no_tracks(self) -> None:
+        """Test that an empty request returns an empty mapping.
+
+        Validates that no executor work is needed for empty input.
+        """
+        service = DJSetProcessorService("http://localhost:8000")
+        assert service.download_tracks("job-1", []) == {}
+
+    @pytest.mark.asyncio
+    async def test_adownload_tracks(self, mocker: MockerFixture) -> None:
+        """Test the async entry point for multi-track downloads.
+
+        Validates that it returns the same mapping as the sync variant.
+        """
+        service = DJSetProcessorService("http://localhost:8000")
+        mocker.patch.object(
+            service,
+            "download_single_track",
+            side_effect=lambda job_id, number, ext: (b"audio", f"track_{number}.mp3"),
+        )
+
+        results = await service.adownload_tracks("job-1", range(1, 3))
+
+        assert results == {1: (b"audio", "track_1.mp3"), 2: (b"audio", "track_2.mp3")}
+
+
+class TestSubmitProcessingJobIfHealthy:
+    """Test cases for the concurrent health check and job submission."""
+
+    @pytest.fixture
+    def service(self) -> DJSetProcessorService:
+        return DJSetProcessorService("http://localhost:8000")
+
+    def test_runs_health_check_and_submission_concurrently(
+        self, service: DJSetProcessorService, mocker: MockerFixture
+    ) -> None:
+        """Test that the submission does not wait for the health check.
+
+        Validates that both requests are in flight at the same time.
+        """
+        submitted = threading.Event()
+
+        def check_health() -> tuple[bool, str]:
+            overlapped = submitted.wait(timeout=5)
+            return overlapped, "Service is healthy: ok"
+
+        def submit_processing_job(*args: object) -> tuple[bool, str, str | None]:
+            submitted.set()
+            return True, "Job submitted successfully", "job-1"
+
+        mocker.patch.object(service, "check_health", side_effect=check_health)
+        mocker.patch.object(
+            service, "submit_processing_job", side_effect=submit_processing_job
+        )
+
+        result = service.submit_processing_job_if_healthy("url", mocker.MagicMock())
+
+        assert result == (True, "Job submitted successfully", "job-1")
+
+    def test_unhealthy_service_cancels_accepted_job(
+        self, service: DJSetProcessorService, mocker: MockerFixture
+    ) -> None:
+        """Test that a job accepted by an unhealthy service is cancelled.
+
+        Validates that the health message is reported instead.
+        """
+        mocker.patch.object(
+            service, "check_health", return_value=(False, "Service unhealthy: down")
+        )
+        mocker.patch.object(
+            service,
+            "submit_processing_job",
+            return_value=(True, "Job submitted successfully", "job-1"),
+        )
+        cancel_job = mocker.patch.object(service, "cancel_job", return_value=True)
+
+        result = service.submit_processing_job_if_healthy("url", mocker.MagicMock())
+
+        assert result == (False, "Service unhealthy: down", None)
+        cancel_job.assert_called_once_with("job-1")
+
+    def test_unhealthy_service_without_job(
+        self, service: DJSetProcessorService, mocker: MockerFixture
+    ) -> None:
+        """Test that nothing is cancelled when the submission also failed.
+
+        Validates the health message takes precedence over the submit error.
+        """
+        mocker.patch.object(
+            service,
+            "check_health",
+            return_value=(False, "Failed to connect to service: refused"),
+        )
+        mocker.patch.object(
+            service,
+            "submit_processing_job",
+            return_value=(False, "Error submitting processing job: refused", None),
+        )
+        cancel_job = mocker.patch.object(service, "cancel_job")
+
+        result = service.submit_processing_job_if_healthy("url", mocker.MagicMock())
+
+        assert result == (False, "Failed to connect to service: refused", None)
+        cancel_job.assert_not_called()
+
+
+class TestCheckHealth:
+    """Test cases for health checks and their short-lived cache."""
+
+    @pytest.fixture
+    def service(self) -> DJSetProcessorService:
+        return DJSetProcessorService("http://localhost:8000")
+
+    def test_healthy_result_is_reused(
+        self, service: DJSetProcessorService, mocker: MockerFixture
+    ) -> None:
+        """Test that a healthy result is served from cache within the TTL.
+
+        Validates that only one request reaches the service.
+        """
+        health_get = mocker.patch.object(
+            service.system_api,
+            "health_get",
+            return_value=mocker.MagicMock(status="healthy"),
+        )
+
+        assert service.check_health() == (True, "Service is healthy: healthy")
+        assert service.check_health() == (True, "Service is healthy: healthy")
+        health_get.assert_called_once()
+
+    def test_healthy_result_expires(
+        self,
+        service: DJSetProcessorService,
+        monkeypatch: MonkeyPatch,
+        mocker: MockerFixture,
+    ) -> None:
+        """Test that the service is asked again once the TTL has passed.
+
+        Validates that a backend that went down is detected.
+        """
+        now = 1000.0
+        monkeypatch.setattr("time.monotonic", lambda: now)
+        health_get = mocker.patch.object(
+            service.system_api,
+            "health_get",
+            side_effect=[mocker.MagicMock(status="ok"), Exception("refused")],
+        )
+
+        assert service.check_health()[0] is True
+        now += HEALTH_CHECK_TTL_SECONDS
+        assert service.check_health() == (
+            False,
+            "Failed to connect to service: refused",
+        )
+        assert health_get.call_count == 2
+
+    def test_unhealthy_result_is_not_cached(
+        self, service: DJSetProcessorService, mocker: MockerFixture
+    ) -> None:
+        """Test that an unhealthy result is re-checked on the next call.
+
+        Validates that recovery is noticed immediately.
+        """
+        health_get = mocker.patch.object(
+            service.system_api,
+            "health_get",
+            side_effect=[
+                mocker.MagicMock(status="degraded"),
+                mocker.MagicMock(status="healthy"),
+            ],
+        )
+
+        assert service.check_health() == (False, "Service unhealthy: degraded")
+        assert service.check_health() == (True, "Service is healthy: healthy")
+        assert health_get.call_count == 2
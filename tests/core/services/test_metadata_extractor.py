@@ -2,15 +2,20 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING
 
 import pytest
 from pydantic import ValidationError
 
 from whats_this_id.core.services.metadata_extractor import (
+    METADATA_CACHE_MAX_ENTRIES,
     ExtractedMetadata,
     MetadataExtractor,
+    _metadata_cache,
+    clear_metadata_cache,
     extract_metadata,
+    get_metadata_extractor,
 )
 
 if TYPE_CHECKING:
@@ -18,6 +23,13 @@ if TYPE_CHECKING:
     from pytest_mock.plugin import MockerFixture
 
 
+@pytest.fixture(autouse=True)
+def reset_metadata_cache() -> None:
+    """Start every test with an empty extraction cache and no shared extractor."""
+    clear_metadata_cache()
+    get_metadata_extractor.cache_clear()
+
+
 class TestExtractedMetadata:
     """Test cases for the ExtractedMetadata Pydantic model."""
 
@@ -92,6 +104,10 @@ class TestMetadataExtractor:
         assert result.artist == "Test Artist"
         assert result.year == 2024
         mock_llm.invoke.assert_called_once()
+        (messages,) = mock_llm.invoke.call_args.args
+        assert len(messages) == 1
+        assert messages[0].type == "human"
+        assert '"Test DJ Set Title 2024"' in messages[0].content
 
     def test_extract_handles_llm_error(
         self, monkeypatch: MonkeyPatch, mocker: MockerFixture
@@ -141,6 +157,176 @@ class TestMetadataExtractor:
         assert "Extracted metadata: artist=Logged Artist, year=2025" in log_output
 
 
+class TestMetadataCache:
+    """Test cases for caching extraction results."""
+
+    def test_repeated_title_hits_cache(
+        self, monkeypatch: MonkeyPatch, mocker: MockerFixture
+    ) -> None:
+        """Test that the same title only reaches the LLM once.
+
+        Validates that case and whitespace variants share a cache entry.
+        """
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key-123")
+        mock_llm = mocker.MagicMock()
+        mock_llm.invoke.return_value = ExtractedMetadata(artist="SHDW", year=2023)
+
+        extractor = MetadataExtractor()
+        extractor.llm = mock_llm
+
+        first = extractor.extract("SHDW @ Boiler Room Berlin 2023")
+        second = extractor.extract("  shdw @ boiler room   berlin 2023")
+
+        assert first == second == ExtractedMetadata(artist="SHDW", year=2023)
+        mock_llm.invoke.assert_called_once()
+
+    def test_cache_is_separate_per_model(
+        self, monkeypatch: MonkeyPatch, mocker: MockerFixture
+    ) -> None:
+        """Test that extractors with different models do not share results.
+
+        Validates that each model's LLM is called for the same title.
+        """
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key-123")
+        mini_llm = mocker.MagicMock()
+        mini_llm.invoke.return_value = ExtractedMetadata(artist="SHDW", year=None)
+        full_llm = mocker.MagicMock()
+        full_llm.invoke.return_value = ExtractedMetadata(artist="SHDW", year=2023)
+
+        mini = MetadataExtractor(model_name="gpt-4.1-mini")
+        mini.llm = mini_llm
+        full = MetadataExtractor(model_name="gpt-4.1")
+        full.llm = full_llm
+
+        assert mini.extract("SHDW 2023").year is None
+        assert full.extract("SHDW 2023").year == 2023
+        assert full.extract_many(["SHDW 2023"])[0].year == 2023
+        mini_llm.invoke.assert_called_once()
+        full_llm.invoke.assert_called_once()
+        full_llm.batch.assert_not_called()
+
+    def test_cached_result_is_a_copy(
+        self, monkeypatch: MonkeyPatch, mocker: MockerFixture
+    ) -> None:
+        """Test that mutating a returned result does not affect the cache.
+
+        Validates that callers cannot corrupt later lookups.
+        """
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key-123")
+        mock_llm = mocker.MagicMock()
+        mock_llm.invoke.return_value = ExtractedMetadata(artist="SHDW", year=2023)
+
+        extractor = MetadataExtractor()
+        extractor.llm = mock_llm
+
+        extractor.extract("SHDW 2023").artist = "changed"
+
+        assert extractor.extract("SHDW 2023").artist == "SHDW"
+
+    def test_failed_extraction_is_not_cached(
+        self, monkeypatch: MonkeyPatch, mocker: MockerFixture
+    ) -> None:
+        """Test that an LLM error is not cached.
+
+        Validates that a retry after a failure reaches the LLM again.
+        """
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key-123")
+        mock_llm = mocker.MagicMock()
+        mock_llm.invoke.side_effect = [
+            Exception("LLM error"),
+            ExtractedMetadata(artist="SHDW", year=None),
+        ]
+
+        extractor = MetadataExtractor()
+        extractor.llm = mock_llm
+
+        with pytest.raises(Exception, match="LLM error"):
+            extractor.extract("SHDW")
+
+        assert extractor.extract("SHDW").artist == "SHDW"
+        assert mock_llm.invoke.call_count == 2
+
+    def test_concurrent_extractions_respect_limit(
+        self, monkeypatch: MonkeyPatch, mocker: MockerFixture
+    ) -> None:
+        """Test that extractions from several threads keep the cache bounded.
+
+        Validates that concurrent insert and eviction do not raise.
+        """
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key-123")
+        mock_llm = mocker.MagicMock()
+        mock_llm.invoke.return_value = ExtractedMetadata(artist="SHDW", year=None)
+
+        extractor = MetadataExtractor()
+        extractor.llm = mock_llm
+
+        def run_extractions(thread_number: int) -> None:
+            for i in range(METADATA_CACHE_MAX_ENTRIES):
+                extractor.extract(f"SHDW {thread_number} {i}")
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(run_extractions, range(8)))
+
+        assert len(_metadata_cache) == METADATA_CACHE_MAX_ENTRIES
+
+
+class TestExtractMany:
+    """Test cases for batched metadata extraction."""
+
+    def test_batches_uncached_titles(
+        self, monkeypatch: MonkeyPatch, mocker: MockerFixture
+    ) -> None:
+        """Test that only uncached, distinct titles are sent in one batch.
+
+        Validates that results come back in the order of the given titles.
+        """
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key-123")
+        mock_llm = mocker.MagicMock()
+        mock_llm.invoke.return_value = ExtractedMetadata(artist="Cached", year=None)
+        mock_llm.batch.return_value = [
+            ExtractedMetadata(artist="SHDW", year=2023),
+            ExtractedMetadata(artist="Alarico", year=None),
+        ]
+
+        extractor = MetadataExtractor()
+        extractor.llm = mock_llm
+        extractor.extract("Cached Set")
+
+        results = extractor.extract_many(
+            ["SHDW 2023", "cached set", "Alarico", "shdw  2023"]
+        )
+
+        assert [result.artist for result in results] == [
+            "SHDW",
+            "Cached",
+            "Alarico",
+            "SHDW",
+        ]
+        prompts = mock_llm.batch.call_args.args[0]
+        assert len(prompts) == 2
+        assert '"SHDW 2023"' in prompts[0][0].content
+        assert '"Alarico"' in prompts[1][0].content
+        assert mock_llm.batch.call_args.kwargs["config"] == {"max_concurrency": 8}
+
+    def test_all_cached_skips_llm(
+        self, monkeypatch: MonkeyPatch, mocker: MockerFixture
+    ) -> None:
+        """Test that a fully cached batch makes no LLM call.
+
+        Validates that batch is not invoked with an empty prompt list.
+        """
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key-123")
+        mock_llm = mocker.MagicMock()
+        mock_llm.invoke.return_value = ExtractedMetadata(artist="SHDW", year=2023)
+
+        extractor = MetadataExtractor()
+        extractor.llm = mock_llm
+        extractor.extract("SHDW 2023")
+
+        assert extractor.extract_many(["SHDW 2023"])[0].artist == "SHDW"
+        mock_llm.batch.assert_not_called()
+
+
 class TestExtractMetadataFunction:
     """Test cases for the extract_metadata convenience function."""
 
@@ -171,6 +357,7 @@ class TestExtractMetadataFunction:
         # Patch the MetadataExtractor to use our mock
         with mocker.patch.object(MetadataExtractor, "__init__", return_value=None):
             extractor = MetadataExtractor()
+            extractor.model_name = "gpt-4.1-mini"
             extractor.llm = mock_llm
 
             # Patch the function to use our mock extractor
@@ -181,3 +368,23 @@ class TestExtractMetadataFunction:
                 result = extract_metadata("Function Test Title")
                 assert result.artist == "Function Artist"
                 assert result.year == 2023
+
+    def test_extract_metadata_reuses_extractor(
+        self, monkeypatch: MonkeyPatch, mocker: MockerFixture
+    ) -> None:
+        """Test that repeated calls share one MetadataExtractor.
+
+        Validates that the OpenAI client is only constructed once.
+        """
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key-123")
+        extractor = mocker.MagicMock()
+        extractor_class = mocker.patch(
+            "whats_this_id.core.services.metadata_extractor.MetadataExtractor",
+            return_value=extractor,
+        )
+
+        extract_metadata("First Title")
+        extract_metadata("Second Title")
+
+        extractor_class.assert_called_once_with()
+        assert extractor.extract.call_count == 2
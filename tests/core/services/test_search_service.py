@@ -0,0 +1,309 @@
+"""Tests for the search service."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+import pytest
+from dj_set_downloader import DomainTrack, DomainTracklist
+
+from whats_this_id.core.search.models import SearchResult
+from whats_this_id.core.search.strategy import SearchStrategy
+from whats_this_id.core.services.search_service import (
+    SEARCH_CACHE_MAX_ENTRIES,
+    SEARCH_CACHE_TTL_SECONDS,
+    SearchService,
+)
+
+if TYPE_CHECKING:
+    from _pytest.monkeypatch import MonkeyPatch
+    from pytest_mock.plugin import MockerFixture
+
+
+class FakeSearchStrategy(SearchStrategy):
+    """Blocking strategy that records the calls made to it."""
+
+    def __init__(self) -> None:
+        self.queries: list[str] = []
+
+    def search(self, query: str) -> list[SearchResult]:
+        self.queries.append(query)
+        return [SearchResult(link="slug", title=query)]
+
+    def get_tracklist(self, url: str) -> tuple[DomainTracklist, str]:
+        return DomainTracklist(name=url, tracks=[], artist="unknown"), url
+
+
+class TestSearchServiceCache:
+    """Test cases for search result caching in SearchService."""
+
+    def test_repeated_query_hits_cache(self, mocker: MockerFixture) -> None:
+        """Test that the same query only reaches the strategy once.
+
+        Validates that case and whitespace variants share a cache entry.
+        """
+        strategy = mocker.MagicMock()
+        strategy.search.return_value = [SearchResult(link="slug", title="Set")]
+        service = SearchService(strategy=strategy)
+
+        first = service.search("Mind Against")
+        second = service.search("  mind   against ")
+
+        assert first == second == [SearchResult(link="slug", title="Set")]
+        strategy.search.assert_called_once_with("Mind Against")
+
+    def test_cached_results_are_copies(self, mocker: MockerFixture) -> None:
+        """Test that callers cannot mutate the cached result list.
+
+        Validates that each call returns a fresh list.
+        """
+        strategy = mocker.MagicMock()
+        strategy.search.return_value = [SearchResult(link="slug", title="Set")]
+        service = SearchService(strategy=strategy)
+
+        service.search("query").clear()
+
+        assert service.search("query") == [SearchResult(link="slug", title="Set")]
+
+    def test_expired_entry_is_refetched(
+        self, monkeypatch: MonkeyPatch, mocker: MockerFixture
+    ) -> None:
+        """Test that results older than the TTL are fetched again.
+
+        Validates that the cache honours SEARCH_CACHE_TTL_SECONDS.
+        """
+        now = 1000.0
+        monkeypatch.setattr("time.monotonic", lambda: now)
+        strategy = mocker.MagicMock()
+        strategy.search.return_value = [SearchResult(link="slug", title="Set")]
+        service = SearchService(strategy=strategy)
+
+        service.search("query")
+        now += SEARCH_CACHE_TTL_SECONDS
+        service.search("query")
+
+        assert strategy.search.call_count == 2
+
+    def test_failed_search_is_not_cached(self, mocker: MockerFixture) -> None:
+        """Test that an exception from the strategy is not cached.
+
+        Validates that a retry after a failure reaches the strategy again.
+        """
+        strategy = mocker.MagicMock()
+        strategy.search.side_effect = [Exception("network error"), []]
+        service = SearchService(strategy=strategy)
+
+        with pytest.raises(Exception, match="network error"):
+            service.search("query")
+
+        assert service.search("query") == []
+        assert strategy.search.call_count == 2
+
+    def test_empty_results_are_not_cached(self, mocker: MockerFixture) -> None:
+        """Test that a search that found nothing is retried.
+
+        Validates that only non-empty results are kept.
+        """
+        strategy = mocker.MagicMock()
+        strategy.search.side_effect = [[], [SearchResult(link="slug", title="Set")]]
+        service = SearchService(strategy=strategy)
+
+        assert service.search("query") == []
+        assert service.search("query") == [SearchResult(link="slug", title="Set")]
+        assert strategy.search.call_count == 2
+
+    def test_concurrent_stores_respect_limit(self) -> None:
+        """Test that searches from several threads keep the cache bounded.
+
+        Validates that concurrent insert and eviction do not raise.
+        """
+        service = SearchService(strategy=FakeSearchStrategy())
+
+        def run_searches(thread_number: int) -> None:
+            for i in range(SEARCH_CACHE_MAX_ENTRIES):
+                service.search(f"query {thread_number} {i}")
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(run_searches, range(8)))
+
+        assert len(service._search_cache) == SEARCH_CACHE_MAX_ENTRIES
+
+    def test_clear_cache(self, mocker: MockerFixture) -> None:
+        """Test that clear_cache forces the next search to refetch.
+
+        Validates the explicit invalidation hook.
+        """
+        strategy = mocker.MagicMock()
+        strategy.search.return_value = [SearchResult(link="slug", title="Set")]
+        service = SearchService(strategy=strategy)
+
+        service.search("query")
+        service.clear_cache()
+        service.search("query")
+
+        assert strategy.search.call_count == 2
+
+
+class TestSearchServiceAsync:
+    """Test cases for the async SearchService entry points."""
+
+    @pytest.mark.asyncio
+    async def test_asearch_runs_blocking_strategy(self) -> None:
+        """Test that asearch delegates to the strategy's blocking search.
+
+        Validates the default thread offload and the shared result cache.
+        """
+        strategy = FakeSearchStrategy()
+        service = SearchService(strategy=strategy)
+
+        results = await service.asearch("query")
+        cached = service.search("QUERY")
+
+        assert results == cached == [SearchResult(link="slug", title="query")]
+        assert strategy.queries == ["query"]
+
+    @pytest.mark.asyncio
+    async def test_aget_tracklist(self) -> None:
+        """Test that aget_tracklist returns the strategy's tracklist and URL.
+
+        Validates the default thread offload for tracklist fetching.
+        """
+        service = SearchService(strategy=FakeSearchStrategy())
+
+        tracklist, url = await service.aget_tracklist("slug")
+
+        assert tracklist.name == "slug"
+        assert url == "slug"
+
+
+class TestSearchServiceStrategy:
+    """Test cases for SearchService strategy selection."""
+
+    def test_default_strategy_is_shared(self) -> None:
+        """Test that services created without a strategy share one instance.
+
+        Validates that the default trackid.net strategy is not rebuilt.
+        """
+        assert SearchService()._strategy is SearchService()._strategy
+
+    def test_explicit_strategy_is_used(self) -> None:
+        """Test that an injected strategy replaces the default.
+
+        Validates constructor dependency injection.
+        """
+        strategy = FakeSearchStrategy()
+        assert SearchService(strategy=strategy)._strategy is strategy
+
+
+class TestAfindTracklist:
+    """Test cases for fetching the first usable tracklist of a search."""
+
+    class CandidateStrategy(FakeSearchStrategy):
+        """Strategy whose tracklists are empty, failing or populated by slug."""
+
+        def search(self, query: str) -> list[SearchResult]:
+            return [
+                SearchResult(link=slug, title=slug)
+                for slug in ("broken", "empty", "full", "ignored")
+            ]
+
+        def get_tracklist(self, url: str) -> tuple[DomainTracklist, str]:
+            self.queries.append(url)
+            if url == "broken":
+                raise Exception("network error")
+            tracks = [DomainTrack(name="Track")] if url != "empty" else []
+            return DomainTracklist(name=url, tracks=tracks, artist="unknown"), url
+
+    @pytest.mark.asyncio
+    async def test_returns_first_non_empty_tracklist(self) -> None:
+        """Test that failing and empty candidates are skipped.
+
+        Validates that only the top candidates are fetched.
+        """
+        strategy = self.CandidateStrategy()
+        service = SearchService(strategy=strategy)
+
+        result = await service.afind_tracklist("query")
+
+        assert result is not None
+        tracklist, url = result
+        assert url == "full"
+        assert len(tracklist.tracks) == 1
+        assert "ignored" not in strategy.queries
+
+    @pytest.mark.asyncio
+    async def test_no_usable_candidate(self) -> None:
+        """Test that None is returned when no candidate has tracks.
+
+        Validates the fallthrough when every fetch is empty or fails.
+        """
+        service = SearchService(strategy=self.CandidateStrategy())
+
+        assert await service.afind_tracklist("query", max_candidates=2) is None
+
+    @pytest.mark.asyncio
+    async def test_pending_async_candidates_are_cancelled(self) -> None:
+        """Test that slower native async candidates are cancelled and awaited.
+
+        Validates that cancellation reaches a strategy overriding
+        aget_tracklist before the result is returned.
+        """
+        cancelled: list[str] = []
+
+        class SlowStrategy(self.CandidateStrategy):
+            def search(self, query: str) -> list[SearchResult]:
+                return [
+                    SearchResult(link=slug, title=slug) for slug in ("full", "slow")
+                ]
+
+            async def aget_tracklist(self, url: str) -> tuple[DomainTracklist, str]:
+                if url == "slow":
+                    try:
+                        await asyncio.sleep(60)
+                    except asyncio.CancelledError:
+                        cancelled.append(url)
+                        raise
+                return self.get_tracklist(url)
+
+        service = SearchService(strategy=SlowStrategy())
+
+        result = await service.afind_tracklist("query")
+
+        assert result is not None
+        assert cancelled == ["slow"]
+
+    @pytest.mark.asyncio
+    async def test_pending_thread_candidates_run_to_completion(self) -> None:
+        """Test that slower thread-backed candidates are not interrupted.
+
+        Validates that the default to_thread fetch returns without waiting
+        for them, and that their worker threads finish on their own.
+        """
+        release = threading.Event()
+        finished = threading.Event()
+
+        class BlockingStrategy(self.CandidateStrategy):
+            def search(self, query: str) -> list[SearchResult]:
+                return [
+                    SearchResult(link=slug, title=slug) for slug in ("full", "slow")
+                ]
+
+            def get_tracklist(self, url: str) -> tuple[DomainTracklist, str]:
+                if url == "slow":
+                    release.wait(timeout=5)
+                    finished.set()
+                return super().get_tracklist(url)
+
+        service = SearchService(strategy=BlockingStrategy())
+
+        result = await service.afind_tracklist("query")
+
+        assert result is not None
+        assert result[1] == "full"
+        assert not finished.is_set()
+
+        release.set()
+        assert await asyncio.to_thread(finished.wait, 5)